@@ -1,4 +1,4 @@
-from .live import ApiLive
-from .pe import ApiPe
+from .live import ApiLive, AsyncApiLive
+from .pe import ApiPe, AsyncApiPe
 
-__all__ = ["ApiLive", "ApiPe"]
+__all__ = ["ApiLive", "ApiPe", "AsyncApiLive", "AsyncApiPe"]
\ No newline at end of file
@@ -1,30 +1,280 @@
-import requests
-from typing import Any, Dict, Dict, Optional
+import asyncio
+import sys
+import threading
+import time
+import httpx
+import orjson
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Callable, Dict, Dict, Hashable, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+from cattrs import Converter
+from cattrs.gen import make_dict_structure_fn, override
 
-class BaseApi:
-    def __init__(self, server: str, token: str, api_type: str):
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the 'Z' suffix natively
+    parse_datetime = datetime.fromisoformat
+else:
+    def parse_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 date, accepting a trailing 'Z' for UTC."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+# Shared converter used to structure API responses into the dataclass models
+converter = Converter()
+converter.register_structure_hook(
+    datetime, lambda v, _: parse_datetime(v) if isinstance(v, str) else v
+)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _is_json_native(tp: Any) -> bool:
+    """Whether values of this type come out of the JSON decoder already in final form."""
+    if tp is Any or tp in _JSON_SCALARS:
+        return True
+    if get_origin(tp) in (Union, list, dict):
+        return all(_is_json_native(arg) for arg in get_args(tp))
+    return False
+
+def _passthrough(value: Any, _: Any) -> Any:
+    return value
+
+# String fields whose values repeat across items and responses, such as machine,
+# tag and resource names. They are interned so repeated polling shares one copy.
+INTERNED_FIELDS = frozenset({'machine', 'name', 'resource', 'type'})
+
+def _intern(value: Any, _: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+def make_structure_fn(cls: type, **overrides: Any) -> Callable[[Dict[str, Any], type], Any]:
+    """Generate a straight-line structuring function for a response dataclass.
+
+    Fields holding plain JSON values are assigned as decoded rather than being
+    converted again, and per-field validation wrappers are left out. String values
+    of the INTERNED_FIELDS are interned.
+    """
+    hints = get_type_hints(cls)
+    for f in fields(cls):
+        if f.name not in overrides and _is_json_native(hints[f.name]):
+            hook = _intern if f.name in INTERNED_FIELDS else _passthrough
+            overrides[f.name] = override(struct_hook=hook)
+    return make_dict_structure_fn(cls, converter, _cattrs_detailed_validation=False, **overrides)
+
+def structure_fn(tp: Any) -> Callable[[Any], Any]:
+    """Resolve the converter's structuring function for a type once, for direct calls."""
+    hook = converter.get_structure_hook(tp)
+    return lambda obj: hook(obj, tp)
+
+def register_structure_fns(*classes: type) -> None:
+    """Register generated structuring functions for the given dataclasses."""
+    for cls in classes:
+        converter.register_structure_hook(cls, make_structure_fn(cls))
+
+# Idempotent requests are retried on these gateway errors
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = [502, 503, 504]
+# and on failures to connect, which never reach the server
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+def _default_headers(token: str, api_type: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "User-Agent": f"AdaptiveApi{api_type.capitalize()}/1.0",
+        "Accept-Encoding": "gzip, deflate, br"
+    }
+
+def _encode_body(body: Any) -> bytes:
+    # Non-string dict keys are converted like json.dumps did rather than rejected
+    return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+
+def _transport_limits() -> httpx.Limits:
+    return httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Cache lifetimes in seconds for endpoints whose data rarely changes
+CACHE_SHORT = 10
+CACHE_NORMAL = 30
+CACHE_LONG = 60
+
+def _cache_key(path: str, query: Optional[dict]) -> Hashable:
+    if not query:
+        return path
+    return path, tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(query.items()))
+
+class _ResponseCache:
+    """Raw response bodies kept for a per-entry time to live.
+
+    Bodies are stored undecoded so every hit is parsed into a fresh object graph.
+    A client may be shared between threads, so all access is serialized by a lock.
+    """
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, content: bytes, ttl: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                for expired in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[expired]
+                if len(self._entries) >= self.maxsize:
+                    # Evict the oldest insertion
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+class _ApiCore:
+    """URL building and response caching shared by the sync and async clients."""
+
+    def __init__(self, server: str, api_type: str):
         self.base_url = f"{server.rstrip('/')}/api/v1/{api_type}"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "User-Agent": f"AdaptiveApi{api_type.capitalize()}/1.0"
-        })
+        self._base_slash = self.base_url + '/'
+        # Full URL by endpoint path, paths are literals so this stays small
+        self._urls: Dict[str, str] = {}
+        self._cache = _ResponseCache()
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses so the next calls hit the server."""
+        self._cache.clear()
 
     def _url(self, path: str) -> str:
-        return f"{self.base_url}/{path.lstrip('/')}"
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = self._base_slash + path.lstrip('/')
+        return url
+
+    def _cached(self, path: str, query: Optional[dict], ttl: Optional[float]) -> Tuple[Optional[Hashable], Optional[bytes]]:
+        """Return the cache key for a request (None when 'ttl' disables caching) and the cached body, if fresh."""
+        if not ttl:
+            return None, None
+        key = _cache_key(path, query)
+        return key, self._cache.get(key)
+
+    def _remember(self, key: Optional[Hashable], content: bytes, ttl: Optional[float]) -> Any:
+        """Store a fetched body under 'key' when caching, and decode it."""
+        if key is not None:
+            self._cache.put(key, content, ttl)
+        return orjson.loads(content)
+
+
+class BaseApi(_ApiCore):
+    def __init__(self, server: str, token: str, api_type: str):
+        super().__init__(server, api_type)
+        # No explicit transport, so HTTP_PROXY/HTTPS_PROXY/NO_PROXY are honoured like requests did
+        self.session = httpx.Client(
+            headers=_default_headers(token, api_type),
+            timeout=10,
+            follow_redirects=True,
+            http2=True,
+            limits=_transport_limits()
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _get(self, path: str, query: Optional[dict] = None, raise_for_status: bool = True) -> httpx.Response:
+        url = self._url(path)
+        for attempt in range(_RETRY_TOTAL + 1):
+            last_attempt = attempt == _RETRY_TOTAL
+            try:
+                response = self.session.get(url, params=query)
+            except _RETRY_ERRORS:
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in _RETRY_STATUSES:
+                    break
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    def _fetch(self, path: str, query: Optional[dict] = None, ttl: Optional[float] = None) -> Any:
+        """Fetch and decode a JSON response, reusing it for 'ttl' seconds if given."""
+        key, content = self._cached(path, query, ttl)
+        if content is not None:
+            return orjson.loads(content)
+        return self._remember(key, self._get(path, query).content, ttl)
 
-    def _fetch(self, path: str, query: Optional[dict] = None) -> Any:
+    def _post(self, path: str, params: Optional[Dict[str, Any]] = None, 
+                    body: Optional[Any] = None) -> Any:
         url = self._url(path)
-        response = self.session.get(url, params=query, timeout=10)
+        data = _encode_body(body) if body is not None else None
+        response = self.session.post(url, params=params, content=data)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
 
+class AsyncBaseApi(_ApiCore):
+    def __init__(self, server: str, token: str, api_type: str):
+        super().__init__(server, api_type)
+        # No explicit transport, so HTTP_PROXY/HTTPS_PROXY/NO_PROXY are honoured like requests did
+        self.client = httpx.AsyncClient(
+            headers=_default_headers(token, api_type),
+            timeout=10,
+            follow_redirects=True,
+            http2=True,
+            limits=_transport_limits()
+        )
 
-    def _post(self, path: str, params: Optional[Dict[str, Any]] = None, 
-                    body: Optional[str] = None) -> Any:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get(self, path: str, query: Optional[dict] = None, raise_for_status: bool = True) -> httpx.Response:
+        url = self._url(path)
+        for attempt in range(_RETRY_TOTAL + 1):
+            last_attempt = attempt == _RETRY_TOTAL
+            try:
+                response = await self.client.get(url, params=query)
+            except _RETRY_ERRORS:
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in _RETRY_STATUSES:
+                    break
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def _fetch(self, path: str, query: Optional[dict] = None, ttl: Optional[float] = None) -> Any:
+        """Fetch and decode a JSON response, reusing it for 'ttl' seconds if given."""
+        key, content = self._cached(path, query, ttl)
+        if content is not None:
+            return orjson.loads(content)
+        return self._remember(key, (await self._get(path, query)).content, ttl)
+
+    async def _post(self, path: str, params: Optional[Dict[str, Any]] = None,
+                    body: Optional[Any] = None) -> Any:
         url = self._url(path)
-        response = self.session.post(url, params=params, json=body, timeout=10)
+        data = _encode_body(body) if body is not None else None
+        response = await self.client.post(url, params=params, content=data)
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return orjson.loads(response.content)
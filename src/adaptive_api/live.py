@@ -1,11 +1,8 @@
-import requests
-from typing import List, Dict, Any, Optional, TypedDict
+from typing import List, Dict, Any, Generic, Optional, Tuple, TypedDict, TypeVar
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass, field
-from dacite import from_dict
-
-from .base import BaseApi
+from .base import CACHE_NORMAL, CACHE_SHORT, AsyncBaseApi, BaseApi, register_structure_fns, structure_fn
 
 # Enums
 class Running(Enum):
@@ -133,18 +130,122 @@ class Command:
     description: Optional[str] = None
     parameters: Optional[List[str]] = None
 
+register_structure_fns(
+    LiveMachine, DashboardEntry, ScreenButton, Job, ScheduledJob, Program, SampleStep, Tag, Command
+)
+
 # Type aliases
 LiveMachines = List[LiveMachine]
 DashboardEntries = List[DashboardEntry]
 
+# Structuring functions are resolved up front so no code generation happens on first use
+_structure_machines = structure_fn(LiveMachines)
+_structure_tags = structure_fn(List[Tag])
+_structure_commands = structure_fn(List[Command])
+_structure_dashboard_entries = structure_fn(DashboardEntries)
+_structure_screen_buttons = structure_fn(List[ScreenButton])
+_structure_program_groups = structure_fn(List[ProgramGroup])
+_structure_jobs = structure_fn(List[ScheduledJob])
+_structure_profile = structure_fn(RunningProfile)
+
+def _structure_profiles(data: Dict[str, Any]) -> Dict[str, Optional[RunningProfile]]:
+    return {
+        machine: _structure_profile(profile_data) if profile_data else None
+        for machine, profile_data in data.items()
+    }
+
+# Query building shared by ApiLive and AsyncApiLive
+def _program_groups_query(machines: List[str], group: Optional[str], only_step_counts: bool) -> Dict[str, Any]:
+    query = {"m": machines}
+    if group is not None:
+        query["group"] = group
+    if only_step_counts:
+        query["onlyStepCounts"] = "true"
+    return query
+
+def _screen_query(machines: List[str], page: Optional[int]) -> Dict[str, Any]:
+    query = {"m": machines}
+    if page is not None:
+        query["page"] = page
+    return query
+
+T = TypeVar("T")
+
+class BatchResult(Generic[T]):
+    """Placeholder for a batched call, resolved when the batch is flushed."""
+    def __init__(self):
+        self._done = False
+        self._value: Optional[T] = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> T:
+        if not self._done:
+            raise RuntimeError("Batch has not been flushed yet")
+        return self._value
+
+    def _resolve(self, value: T) -> None:
+        self._value = value
+        self._done = True
+
+class LiveBatch:
+    """Collects single machine calls and issues one request per endpoint on flush."""
+    def __init__(self, api: "ApiLive"):
+        self._api = api
+        self._tags: Dict[str, List[BatchResult[List[Tag]]]] = {}
+        self._tag_values: Dict[Tuple[str, ...], Dict[str, List[BatchResult[List[Any]]]]] = {}
+
+    def __enter__(self) -> "LiveBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def tags(self, machine: str) -> BatchResult[List[Tag]]:
+        """Queue a tags request for a single machine."""
+        result = BatchResult()
+        self._tags.setdefault(machine, []).append(result)
+        return result
+
+    def tag_values(self, machine: str, tags: List[str]) -> BatchResult[List[Any]]:
+        """Queue a tag values request for a single machine."""
+        result = BatchResult()
+        self._tag_values.setdefault(tuple(tags), {}).setdefault(machine, []).append(result)
+        return result
+
+    def flush(self) -> None:
+        """Send the queued calls, one request per endpoint and tag list."""
+        pending_tags, self._tags = self._tags, {}
+        pending_tag_values, self._tag_values = self._tag_values, {}
+        if pending_tags:
+            data = self._api.tags_multiple(list(pending_tags))
+            for machine, results in pending_tags.items():
+                for result in results:
+                    result._resolve(data.get(machine, []))
+        for tags, pending in pending_tag_values.items():
+            data = self._api.tag_values_multiple(list(pending), list(tags))
+            for machine, results in pending.items():
+                for result in results:
+                    result._resolve(data.get(machine, []))
+
 class ApiLive(BaseApi):
     def __init__(self, server: str, token: str):
         super().__init__(server, token, "live")
 
+    def batch(self) -> LiveBatch:
+        """Coalesce single machine tags/tag_values calls into multi-machine requests.
+
+        Results are available from the returned placeholders once the batch is flushed,
+        which happens automatically when used as a context manager.
+        """
+        return LiveBatch(self)
+
     def machines(self, machines: Optional[List[str]] = None) -> LiveMachines:
         """Fetch a list of machines. If 'machines' is provided, fetch only those."""
         data = self._fetch("machines", {"m": machines} if machines else None)
-        return [from_dict(LiveMachine, item) for item in data]
+        return _structure_machines(data)
 
     def tag_values_multiple(self, machines: List[str], tags: List[str]) -> Dict[str, List[Any]]:
         """Fetch values for the same tags from multiple machines."""
@@ -157,8 +258,8 @@ class ApiLive(BaseApi):
 
     def tags_multiple(self, machines: List[str]) -> Dict[str, List[Tag]]:
         """Fetch tags for multiple machines."""
-        data = self._fetch("tags", {"m": machines})
-        return {machine: [from_dict(Tag, tag) for tag in tags] for machine, tags in data.items()}
+        data = self._fetch("tags", {"m": machines}, ttl=CACHE_SHORT)
+        return {machine: _structure_tags(tags) for machine, tags in data.items()}
 
     def tags(self, machine: str) -> List[Tag]:
         """Fetch tags for a single machine."""
@@ -167,8 +268,8 @@ class ApiLive(BaseApi):
 
     def commands_multiple(self, machines: List[str]) -> Dict[str, List[Command]]:
         """Fetch commands for multiple machines."""
-        data = self._fetch("commands", {"m": machines})
-        return {machine: [from_dict(Command, cmd) for cmd in commands] for machine, commands in data.items()}
+        data = self._fetch("commands", {"m": machines}, ttl=CACHE_NORMAL)
+        return {machine: _structure_commands(commands) for machine, commands in data.items()}
 
     def commands(self, machine: str) -> List[Command]:
         """Fetch commands for a single machine."""
@@ -178,28 +279,26 @@ class ApiLive(BaseApi):
     def dashboard_entries(self) -> DashboardEntries:
         """Fetch dashboard entries."""
         data = self._fetch("dashboardEntries")
-        return [from_dict(DashboardEntry, item) for item in data]
+        return _structure_dashboard_entries(data)
 
     def dashboard(self, name: str) -> Optional[bytes]:
         """Fetch a dashboard by name, returns binary data or None if not found."""
-        url = self._url("dashboard")
-        response = self.session.get(url, params={"name": name}, timeout=10)
+        response = self._get("dashboard", {"name": name}, raise_for_status=False)
         if response.status_code == 200:
             return response.content
         return None
 
     def scene(self, name: str) -> Optional[bytes]:
         """Fetch a scene by name, returns binary data or None if not found."""
-        url = self._url("scene")
-        response = self.session.get(url, params={"name": name}, timeout=10)
+        response = self._get("scene", {"name": name}, raise_for_status=False)
         if response.status_code == 200:
             return response.content
         return None
 
     def screen_buttons_multiple(self, machines: List[str]) -> Dict[str, List[ScreenButton]]:
         """Fetch screen buttons for multiple machines."""
-        data = self._fetch("screenButtons", {"m": machines})
-        return {machine: [from_dict(ScreenButton, btn) for btn in buttons] for machine, buttons in data.items()}
+        data = self._fetch("screenButtons", {"m": machines}, ttl=CACHE_NORMAL)
+        return {machine: _structure_screen_buttons(buttons) for machine, buttons in data.items()}
 
     def screen_buttons(self, machine: str) -> List[ScreenButton]:
         """Fetch screen buttons for a single machine."""
@@ -208,20 +307,10 @@ class ApiLive(BaseApi):
 
     def program_groups_multiple(self, machines: List[str], group: Optional[str] = None, only_step_counts: bool = False) -> Dict[str, List[ProgramGroup]]:
         """Fetch program groups for multiple machines."""
-        query = {"m": machines}
-        if group is not None:
-            query["group"] = group
-        if only_step_counts:
-            query["onlyStepCounts"] = "true"
+        query = _program_groups_query(machines, group, only_step_counts)
         data = self._fetch("programs", query)
         
-        result = {}
-        for machine, groups in data.items():
-            result[machine] = []
-            for group_data in groups:
-                programs = [from_dict(Program, prog) for prog in group_data.get('programs', [])]
-                result[machine].append(ProgramGroup(group=group_data['group'], programs=programs))
-        return result
+        return {machine: _structure_program_groups(groups) for machine, groups in data.items()}
 
     def program_groups(self, machine: str, group: Optional[str] = None, only_step_counts: bool = False) -> List[ProgramGroup]:
         """Fetch program groups for a single machine."""
@@ -231,7 +320,7 @@ class ApiLive(BaseApi):
     def jobs_multiple(self, machines: List[str]) -> Dict[str, List[ScheduledJob]]:
         """Fetch scheduled jobs for multiple machines."""
         data = self._fetch("jobs", {"m": machines})
-        return {machine: [from_dict(ScheduledJob, job) for job in jobs] for machine, jobs in data.items()}
+        return {machine: _structure_jobs(jobs) for machine, jobs in data.items()}
 
     def jobs(self, machine: str) -> List[ScheduledJob]:
         """Fetch scheduled jobs for a single machine."""
@@ -250,24 +339,11 @@ class ApiLive(BaseApi):
     def profiles(self, machines: List[str]) -> Dict[str, Optional[RunningProfile]]:
         """Fetch running profiles for multiple machines."""
         data = self._fetch("profiles", {"m": machines})
-        result = {}
-        for machine, profile_data in data.items():
-            if profile_data:
-                sample_steps = [from_dict(SampleStep, step) for step in profile_data.get('sampleSteps', [])]
-                result[machine] = RunningProfile(
-                    currentStep=profile_data['currentStep'],
-                    changingStep=profile_data['changingStep'],
-                    sampleSteps=sample_steps
-                )
-            else:
-                result[machine] = None
-        return result
+        return _structure_profiles(data)
 
     def screen_multiple(self, machines: List[str], page: Optional[int] = None) -> Dict[str, List[str]]:
         """Fetch screen data for multiple machines."""
-        query = {"m": machines}
-        if page is not None:
-            query["page"] = page
+        query = _screen_query(machines, page)
         return self._fetch("screen", query)
 
     def screen(self, machine: str, page: Optional[int] = None) -> List[str]:
@@ -314,4 +390,159 @@ class ApiLive(BaseApi):
 
     def set_mode(self, machine: str, mode: Mode) -> Any:
         """Set the mode for a machine. Can be fetched in Parent.Mode."""
-        return self._post('setMode', {'m': machine, 'mode': mode.value})
\ No newline at end of file
+        return self._post('setMode', {'m': machine, 'mode': mode.value})
+
+
+class AsyncApiLive(AsyncBaseApi):
+    """Asynchronous variant of ApiLive for issuing concurrent requests."""
+
+    def __init__(self, server: str, token: str):
+        super().__init__(server, token, "live")
+
+    async def machines(self, machines: Optional[List[str]] = None) -> LiveMachines:
+        """Fetch a list of machines. If 'machines' is provided, fetch only those."""
+        data = await self._fetch("machines", {"m": machines} if machines else None)
+        return _structure_machines(data)
+
+    async def tag_values_multiple(self, machines: List[str], tags: List[str]) -> Dict[str, List[Any]]:
+        """Fetch values for the same tags from multiple machines."""
+        return await self._fetch("tagValues", {"m": machines, "t": tags})
+
+    async def tag_values(self, machine: str, tags: List[str]) -> List[Any]:
+        """Fetch values for a single machine and extract the specific data."""
+        data = await self.tag_values_multiple([machine], tags)
+        return data.get(machine, [])
+
+    async def tags_multiple(self, machines: List[str]) -> Dict[str, List[Tag]]:
+        """Fetch tags for multiple machines."""
+        data = await self._fetch("tags", {"m": machines}, ttl=CACHE_SHORT)
+        return {machine: _structure_tags(tags) for machine, tags in data.items()}
+
+    async def tags(self, machine: str) -> List[Tag]:
+        """Fetch tags for a single machine."""
+        data = await self.tags_multiple([machine])
+        return data.get(machine, [])
+
+    async def commands_multiple(self, machines: List[str]) -> Dict[str, List[Command]]:
+        """Fetch commands for multiple machines."""
+        data = await self._fetch("commands", {"m": machines}, ttl=CACHE_NORMAL)
+        return {machine: _structure_commands(commands) for machine, commands in data.items()}
+
+    async def commands(self, machine: str) -> List[Command]:
+        """Fetch commands for a single machine."""
+        data = await self.commands_multiple([machine])
+        return data.get(machine, [])
+
+    async def dashboard_entries(self) -> DashboardEntries:
+        """Fetch dashboard entries."""
+        data = await self._fetch("dashboardEntries")
+        return _structure_dashboard_entries(data)
+
+    async def dashboard(self, name: str) -> Optional[bytes]:
+        """Fetch a dashboard by name, returns binary data or None if not found."""
+        response = await self._get("dashboard", {"name": name}, raise_for_status=False)
+        if response.status_code == 200:
+            return response.content
+        return None
+
+    async def scene(self, name: str) -> Optional[bytes]:
+        """Fetch a scene by name, returns binary data or None if not found."""
+        response = await self._get("scene", {"name": name}, raise_for_status=False)
+        if response.status_code == 200:
+            return response.content
+        return None
+
+    async def screen_buttons_multiple(self, machines: List[str]) -> Dict[str, List[ScreenButton]]:
+        """Fetch screen buttons for multiple machines."""
+        data = await self._fetch("screenButtons", {"m": machines}, ttl=CACHE_NORMAL)
+        return {machine: _structure_screen_buttons(buttons) for machine, buttons in data.items()}
+
+    async def screen_buttons(self, machine: str) -> List[ScreenButton]:
+        """Fetch screen buttons for a single machine."""
+        data = await self.screen_buttons_multiple([machine])
+        return data.get(machine, [])
+
+    async def program_groups_multiple(self, machines: List[str], group: Optional[str] = None, only_step_counts: bool = False) -> Dict[str, List[ProgramGroup]]:
+        """Fetch program groups for multiple machines."""
+        query = _program_groups_query(machines, group, only_step_counts)
+        data = await self._fetch("programs", query)
+        
+        return {machine: _structure_program_groups(groups) for machine, groups in data.items()}
+
+    async def program_groups(self, machine: str, group: Optional[str] = None, only_step_counts: bool = False) -> List[ProgramGroup]:
+        """Fetch program groups for a single machine."""
+        data = await self.program_groups_multiple([machine], group, only_step_counts)
+        return data.get(machine, [])
+
+    async def jobs_multiple(self, machines: List[str]) -> Dict[str, List[ScheduledJob]]:
+        """Fetch scheduled jobs for multiple machines."""
+        data = await self._fetch("jobs", {"m": machines})
+        return {machine: _structure_jobs(jobs) for machine, jobs in data.items()}
+
+    async def jobs(self, machine: str) -> List[ScheduledJob]:
+        """Fetch scheduled jobs for a single machine."""
+        data = await self.jobs_multiple([machine])
+        return data.get(machine, [])
+
+    async def messages_multiple(self, machines: List[str]) -> Dict[str, List[str]]:
+        """Fetch messages for multiple machines."""
+        return await self._fetch("messages", {"m": machines})
+
+    async def messages(self, machine: str) -> List[str]:
+        """Fetch messages for a single machine."""
+        data = await self.messages_multiple([machine])
+        return data.get(machine, [])
+
+    async def profiles(self, machines: List[str]) -> Dict[str, Optional[RunningProfile]]:
+        """Fetch running profiles for multiple machines."""
+        data = await self._fetch("profiles", {"m": machines})
+        return _structure_profiles(data)
+
+    async def screen_multiple(self, machines: List[str], page: Optional[int] = None) -> Dict[str, List[str]]:
+        """Fetch screen data for multiple machines."""
+        query = _screen_query(machines, page)
+        return await self._fetch("screen", query)
+
+    async def screen(self, machine: str, page: Optional[int] = None) -> List[str]:
+        """Fetch screen data for a single machine."""
+        data = await self.screen_multiple([machine], page)
+        return data.get(machine, [])
+
+    url_command_icon = ApiLive.url_command_icon
+
+    # Machine control methods (require change permissions)
+    async def run(self, machine: str) -> Any:
+        """Start/run a machine."""
+        return await self._post('run', {'m': machine})
+
+    async def backward(self, machine: str) -> Any:
+        """Move machine backward."""
+        return await self._post('backward', {'m': machine})
+
+    async def forward(self, machine: str) -> Any:
+        """Move machine forward."""
+        return await self._post('forward', {'m': machine})
+
+    async def pause(self, machine: str) -> Any:
+        """Pause a machine."""
+        return await self._post('pause', {'m': machine})
+
+    async def stop(self, machine: str) -> Any:
+        """Stop a machine."""
+        return await self._post('stop', {'m': machine})
+
+    async def yes(self, machine: str) -> Any:
+        """Send 'yes' response to machine."""
+        return await self._post('yes', {'m': machine})
+
+    async def no(self, machine: str) -> Any:
+        """Send 'no' response to machine."""
+        return await self._post('no', {'m': machine})
+
+    async def set_step(self, machine: str, step: int) -> Any:
+        """Set the current step for a machine. Can be fetched in Parent.CurrentStep."""
+        return await self._post('setStep', {'m': machine, 'step': step})
+
+    async def set_mode(self, machine: str, mode: Mode) -> Any:
+        """Set the mode for a machine. Can be fetched in Parent.Mode."""
+        return await self._post('setMode', {'m': machine, 'mode': mode.value})
\ No newline at end of file
@@ -1,26 +1,28 @@
 from typing import List, Dict, Any, Optional, Union, Callable, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
 import csv
 from io import StringIO
+from itertools import repeat
 from enum import Enum
-from dacite import from_dict, Config
+from functools import lru_cache
 
-import requests
+import numpy as np
+from cattrs.gen import override
 
-from .base import BaseApi
+from .base import (
+    CACHE_LONG, AsyncBaseApi, BaseApi, converter, make_structure_fn, parse_datetime, register_structure_fns,
+    structure_fn
+)
 
 def to_key_string(key: List[Any]) -> str:
     """Convert a key array to a string representation."""
+    # Trailing empty parts are dropped
     j = len(key)
-    while j != 0:
-        v = key[j - 1]
-        if v != '' and v != 0:
-            break
+    while j != 0 and key[j - 1] in ('', 0):
         j -= 1
     
-    return '@'.join('' if it == ' ' else str(it) for it in key[:j])
+    return '@'.join(['' if it == ' ' else str(it) for it in key[:j]])
 
 def id_to_string(id_value: Any) -> str:
     """Convert an ID to string representation."""
@@ -32,18 +34,12 @@ def id_to_string(id_value: Any) -> str:
 
 def string_to_id(s: str) -> Union[str, List[Union[str, int]]]:
     """Convert a string back to an ID."""
-    parts = s.split('@')
-    if len(parts) == 1:
+    first, separator, rest = s.partition('@')
+    if not separator:
         return s
     
-    id_parts = []
-    for index, value in enumerate(parts):
-        if index == 0:
-            id_parts.append(' ' if value == '' else value)
-        else:
-            id_parts.append(int(value))
-    
-    return id_parts
+    # Only the leading part is a string, the rest are integers
+    return [' ' if first == '' else first] + [int(value) for value in rest.split('@')]
 
 def id_equals(x: Any, y: Any) -> bool:
     """Check if two IDs are equal."""
@@ -157,7 +153,7 @@ class Job(InBoxJob):
 
 def item_is_job(item: Union[Job, InBoxJob]) -> Optional[Job]:
     """Check if an item is a Job (has start time)."""
-    return item if hasattr(item, 'start') and item.start is not None else None
+    return item if isinstance(item, Job) and item.start is not None else None
 
 @dataclass
 class InBoxGroupAndJobs:
@@ -182,7 +178,7 @@ class Stoppage(ResourceEvent):
 
 def is_stoppage(value: Union[Job, Stoppage]) -> bool:
     """Check if a value is a Stoppage."""
-    return hasattr(value, 'stoppage')
+    return isinstance(value, Stoppage)
 
 @dataclass
 class ResourceJobEvent(ResourceEvent):
@@ -202,16 +198,6 @@ class DelayEvent(ResourceEvent):
 SearchResult = Union[Job, InBoxJob]
 
 
-@dataclass
-class AdaptiveHistory:
-    """Adaptive history data structure."""
-    id: str
-    start: datetime
-    end: datetime
-    elapsedTimes: List[int]
-    tags: List['HistoryTag']
-    commands: Optional[List[Command]] = None
-
 @dataclass
 class Tag:
     """Tag data structure."""
@@ -227,131 +213,123 @@ class Tag:
 
 @dataclass
 class HistoryTag(Tag):
-    """History tag that extends Tag."""
-    elapsedIndexes: List[int] = field(default_factory=list)
-    values: List[Any] = field(default_factory=list)
+    """History tag that extends Tag.
+
+    The samples are stored as NumPy arrays: int64 indexes, and values typed by tag type.
+    """
+    elapsedIndexes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64), compare=False)
+    values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object), compare=False)
+
+    def __eq__(self, other: object) -> bool:
+        # Arrays are compared as a whole, a generated __eq__ would compare them elementwise
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (Tag.__eq__(self, other)
+                and np.array_equal(self.elapsedIndexes, other.elapsedIndexes)
+                and np.array_equal(self.values, other.values))
+
+@dataclass
+class AdaptiveHistory:
+    """Adaptive history data structure."""
+    id: str
+    start: datetime
+    end: datetime
+    elapsedTimes: List[int]
+    tags: List[HistoryTag]
+    commands: Optional[List[Command]] = None
+
+# Tag.type is either a plain type name or a structured type description
+converter.register_structure_hook(Union[str, Dict[str, Any]], lambda v, _: v)
+
+def _number_values(values: List[Any]) -> np.ndarray:
+    """Numeric deltas as an int64 or float64 array, keeping ints exact ahead of the first float."""
+    array = np.asarray(values)
+    if array.size and array.dtype.kind == 'f' and isinstance(values[0], int):
+        # Summed as Python numbers, the running values stay ints until the first float delta
+        return np.fromiter(values, dtype=object, count=len(values))
+    return array
+
+# Value array builders by tag type, anything else is kept as Python objects
+_HISTORY_VALUE_ARRAYS: Dict[str, Callable[[List[Any]], np.ndarray]] = {
+    'number': _number_values,
+    'date': _number_values,
+    'boolean': lambda values: np.asarray(values, dtype=bool),
+}
+
+_structure_history_tag_fields = make_structure_fn(
+    HistoryTag, elapsedIndexes=override(omit=True), values=override(omit=True)
+)
+
+def _structure_history_tag(data: Dict[str, Any], cl: type) -> HistoryTag:
+    """Structure a history tag, building its sample arrays straight from the JSON lists."""
+    tag = _structure_history_tag_fields(data, cl)
+    tag.elapsedIndexes = np.asarray(data.get('elapsedIndexes', ()), dtype=np.int64)
+    values = data.get('values', ())
+    build_values = _HISTORY_VALUE_ARRAYS.get(tag.type) if isinstance(tag.type, str) else None
+    if build_values is not None:
+        tag.values = build_values(values)
+    else:
+        tag.values = np.fromiter(values, dtype=object, count=len(values))
+    return tag
+
+converter.register_structure_hook(HistoryTag, _structure_history_tag)
+register_structure_fns(InBoxJob, Job, ResourceEvent, Stoppage, Program, ProgramSection, DailyJobCount)
+
+# Structuring functions are resolved up front so no code generation happens on first use
+_structure_program_groups = structure_fn(List[ProgramGroup])
+_structure_reschedule_groups = structure_fn(List[RescheduleGroup])
+_structure_daily_job_counts = structure_fn(List[DailyJobCount])
+_structure_history = structure_fn(AdaptiveHistory)
+_structure_job = structure_fn(Job)
+_structure_stoppage = structure_fn(Stoppage)
+_structure_inbox_job = structure_fn(InBoxJob)
+_structure_inbox_group = structure_fn(InBoxGroupAndJobs)
+_structure_resource_event = structure_fn(ResourceEvent)
 
 
 class ApiPe(BaseApi):
     def __init__(self, server: str, token: str):
         super().__init__(server, token, "pe")
     """Client for Adaptive PE API."""
-    _config = Config(type_hooks={
-        datetime: lambda v: datetime.fromisoformat(v.replace('Z', '+00:00')) if isinstance(v, str) else v
-    })
-    
-    
-    def _fix_date(self, value: Any) -> Any:
-        """Convert date strings to timestamps."""
-        if isinstance(value, str):
-            try:
-                dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return value
-        return value
     
     # API Methods
     
     def program_group_names(self) -> List[str]:
         """Fetch program group names."""
-        return self._fetch('programGroupNames')
+        return self._fetch('programGroupNames', ttl=CACHE_LONG)
     
     def program_groups(self, group: Optional[Union[str, List[str]]] = None,
                                   number: Optional[Union[str, List[str]]] = None,
                                   only_step_counts: bool = False) -> List[ProgramGroup]:
         """Fetch program groups."""
-        params = {}
-        if group is not None:
-            params['group'] = group
-        if number is not None:
-            params['number'] = number
-        if only_step_counts:
-            params['onlyStepCounts'] = True
-        
+        params = _program_groups_params(group, number, only_step_counts)
         data = self._fetch('programGroups', params)
-        return [from_dict(ProgramGroup, item, self._config) for item in data]
+        return _structure_program_groups(data)
     
     def history(self, job_id: Any, tags_filter: Optional[str] = None, tags: Optional[List[str]] = None) -> Optional[AdaptiveHistory]:
         """Fetch history for given ID."""
-        params = {'id': id_to_string(job_id)}
-        if tags_filter:
-            params['tagsFilter'] = tags_filter
-        if tags:
-            params['tags'] = ','.join(tags)
-        
-        response_json = self._fetch('history', params)
-        if not response_json:
-            return None
-        history = from_dict(AdaptiveHistory, response_json, self._config)        
-        _fix_history(history)
-        return history
+        params = _history_params(job_id, tags_filter, tags)
+        return _parse_history(self._fetch('history', params))
 
 
     def reschedule_groups(self) -> List[RescheduleGroup]:
         """Fetch reschedule groups."""
         data = self._fetch('rescheduleGroups')
-        return [from_dict(RescheduleGroup, item, self._config) for item in data]
+        return _structure_reschedule_groups(data)
     
     def jobs_and_stoppages(self, after: Optional[int] = None, before: Optional[int] = None,
                            starts_in_range: bool = False, no_jobs: bool = False,
                            no_stoppages: bool = False, job_props: Optional[List[str]] = None) -> List[Union[Job, Stoppage]]:
         """Fetch jobs and stoppages."""
-        params = {}
-        if after is not None:
-            params['after'] = datetime.fromtimestamp(after / 1000).isoformat()
-        if before is not None:
-            params['before'] = datetime.fromtimestamp(before / 1000).isoformat()
-        if starts_in_range:
-            params['startsInRange'] = True
-        if no_jobs:
-            params['noJobs'] = True
-        if no_stoppages:
-            params['noStoppages'] = True
-        if job_props:
-            params['jobProps'] = job_props
-        
-        data = self._fetch('jobs', params)
-        
-        # Convert dates to numbers
-        for item in data:
-            item['start'] = self._fix_date(item['start'])
-            item['end'] = self._fix_date(item['end'])
-        
-        # Convert to appropriate objects
-        result = []
-        for item in data:
-            if 'stoppage' in item:
-                result.append(from_dict(Stoppage, item, self._config))
-            else:
-                result.append(from_dict(Job, item, self._config))
-        
-        return result
+        params = _jobs_params(after, before, starts_in_range, no_jobs, no_stoppages, job_props)
+        return _parse_jobs_and_stoppages(self._fetch('jobs', params))
     
     def resource_events(self, alarms: bool = False, delays: bool = False,
                         stoppages: bool = False, after: Optional[int] = None,
                         before: Optional[int] = None) -> List[ResourceEvent]:
         """Fetch resource events."""
-        params = {}
-        if alarms:
-            params['alarms'] = True
-        if delays:
-            params['delays'] = True
-        if stoppages:
-            params['stoppages'] = True
-        if after is not None:
-            params['after'] = datetime.fromtimestamp(after / 1000).isoformat()
-        if before is not None:
-            params['before'] = datetime.fromtimestamp(before / 1000).isoformat()
-        
-        data = self._fetch('resourceEvents', params)
-        
-        # Convert dates to numbers
-        for item in data:
-            item['start'] = self._fix_date(item['start'])
-            item['end'] = self._fix_date(item['end'])
-        
-        return [from_dict(ResourceEvent, item, self._config) for item in data]
+        params = _resource_events_params(alarms, delays, stoppages, after, before)
+        return _parse_resource_events(self._fetch('resourceEvents', params))
     
     def group_resource_events(self, events: Optional[List[ResourceEvent]], 
                              get_name: Callable[[ResourceEvent], str]) -> Optional[Dict[str, Dict[str, int]]]:
@@ -375,110 +353,340 @@ class ApiPe(BaseApi):
     
     def inbox_jobs(self) -> List[InBoxGroupAndJobs]:
         """Fetch inbox jobs."""
-        data = self._fetch('inBoxJobs')
-        
-        # Repopulate resource in each job
-        result = []
-        for group_data in data:
-            group = from_dict(InBoxGroupAndJobs, group_data, self._config)
-            if group.jobs:
-                for job in group.jobs:
-                    job.resource = group.group
-            result.append(group)
-        
-        return result
+        return _parse_inbox_jobs(self._fetch('inBoxJobs'))
     
     def search(self, text: str, limit: Optional[int] = None) -> List[SearchResult]:
         """Search for jobs/items."""
-        params = {'text': text}
-        if limit is not None:
-            params['limit'] = limit
-        
-        data = self._fetch('search', params)
-        
-        # Convert dates to numbers
-        for item in data:
-            if 'start' in item:
-                item['start'] = self._fix_date(item['start'])
-        
-        # Convert to appropriate objects
-        result = []
-        for item in data:
-            if 'start' in item:
-                result.append(from_dict(Job, item, self._config))
-            else:
-                result.append(from_dict(InBoxJob, item, self._config))
-        
-        return result
+        params = _search_params(text, limit)
+        return _parse_search(self._fetch('search', params))
     
     def daily_job_count(self) -> List[DailyJobCount]:
         """Fetch daily job count."""
         data = self._fetch('dailyJobCount')
-        return [from_dict(DailyJobCount, item, self._config) for item in data]
+        return _structure_daily_job_counts(data)
     
     # Change operations (from apiPeChange.ts)
     
     def insert_jobs(self, inserts: List[Dict[str, Any]]) -> Any:
         """Insert jobs."""
-        return self._post('insertJobs', body=json.dumps(inserts))
+        return self._post('insertJobs', body=inserts)
     
     def update_jobs(self, updates: List[Dict[str, Any]]) -> Any:
         """Update jobs."""
-        return self._post('updateJobs', body=json.dumps(updates))
+        return self._post('updateJobs', body=updates)
     
     def delete_jobs(self, ids: List[Any]) -> Any:
         """Delete jobs."""
-        return self._post('deleteJobs', body=json.dumps(ids))
+        return self._post('deleteJobs', body=ids)
     
     def insert_programs(self, inserts: List[Dict[str, Any]]) -> Any:
         """Insert programs."""
-        return self._post('insertPrograms', body=json.dumps(inserts))
+        return self._post('insertPrograms', body=inserts)
     
     def update_programs(self, updates: List[Dict[str, Any]]) -> Any:
         """Update programs."""
-        return self._post('updatePrograms', body=json.dumps(updates))
+        return self._post('updatePrograms', body=updates)
     
     def delete_programs(self, ids: List[Dict[str, str]]) -> Any:
         """Delete programs."""
-        return self._post('deletePrograms', body=json.dumps(ids))
-    
-def _fix_history(history: AdaptiveHistory) -> None:
-    """Fix the history data structure."""
-    # The JSON on the wire is in a smaller form that we fix here
-    prev = 0
-    prev_delta = 0
-    elapsed_times = history.elapsedTimes
-    for i in range(len(elapsed_times)):
-        delta = prev_delta + elapsed_times[i]
-        prev_delta = delta
-        value = prev + delta
-        prev = value
-        elapsed_times[i] = value
-    for tag in history.tags:
-        prev = 0
-        elapsed_indexes = tag.elapsedIndexes
-        for i in range(len(elapsed_indexes)):
-            value = prev + elapsed_indexes[i]
-            prev = value
-            elapsed_indexes[i] = value
-            
-        if tag.type == 'number' or tag.type == 'date':
-            values = tag.values
-            prev = 0
-            for i in range(len(values)):
-                value = prev + values[i]
-                prev = value
-                values[i] = value
-        elif tag.type == 'boolean':            
-            values1 = tag.values
-            if len(values1) > 0:
-                last_value = values1[0]  # a single initial value
-                # Expand to full length by alternating values
-                expanded_values = [last_value]
-                for i in range(1, len(tag.elapsedIndexes)):
-                    last_value = not last_value
-                    expanded_values.append(last_value)
-                tag.values = expanded_values
+        return self._post('deletePrograms', body=ids)
+    
+class AsyncApiPe(AsyncBaseApi):
+    """Asynchronous variant of ApiPe for issuing concurrent requests."""
+
+    def __init__(self, server: str, token: str):
+        super().__init__(server, token, "pe")
+    
+    # API Methods
+    
+    async def program_group_names(self) -> List[str]:
+        """Fetch program group names."""
+        return await self._fetch('programGroupNames', ttl=CACHE_LONG)
+    
+    async def program_groups(self, group: Optional[Union[str, List[str]]] = None,
+                                  number: Optional[Union[str, List[str]]] = None,
+                                  only_step_counts: bool = False) -> List[ProgramGroup]:
+        """Fetch program groups."""
+        params = _program_groups_params(group, number, only_step_counts)
+        data = await self._fetch('programGroups', params)
+        return _structure_program_groups(data)
+    
+    async def history(self, job_id: Any, tags_filter: Optional[str] = None, tags: Optional[List[str]] = None) -> Optional[AdaptiveHistory]:
+        """Fetch history for given ID."""
+        params = _history_params(job_id, tags_filter, tags)
+        return _parse_history(await self._fetch('history', params))
+
+
+    async def reschedule_groups(self) -> List[RescheduleGroup]:
+        """Fetch reschedule groups."""
+        data = await self._fetch('rescheduleGroups')
+        return _structure_reschedule_groups(data)
+    
+    async def jobs_and_stoppages(self, after: Optional[int] = None, before: Optional[int] = None,
+                           starts_in_range: bool = False, no_jobs: bool = False,
+                           no_stoppages: bool = False, job_props: Optional[List[str]] = None) -> List[Union[Job, Stoppage]]:
+        """Fetch jobs and stoppages."""
+        params = _jobs_params(after, before, starts_in_range, no_jobs, no_stoppages, job_props)
+        return _parse_jobs_and_stoppages(await self._fetch('jobs', params))
+    
+    async def resource_events(self, alarms: bool = False, delays: bool = False,
+                        stoppages: bool = False, after: Optional[int] = None,
+                        before: Optional[int] = None) -> List[ResourceEvent]:
+        """Fetch resource events."""
+        params = _resource_events_params(alarms, delays, stoppages, after, before)
+        return _parse_resource_events(await self._fetch('resourceEvents', params))
+    
+    group_resource_events = ApiPe.group_resource_events
+    
+    async def inbox_jobs(self) -> List[InBoxGroupAndJobs]:
+        """Fetch inbox jobs."""
+        return _parse_inbox_jobs(await self._fetch('inBoxJobs'))
+    
+    async def search(self, text: str, limit: Optional[int] = None) -> List[SearchResult]:
+        """Search for jobs/items."""
+        params = _search_params(text, limit)
+        return _parse_search(await self._fetch('search', params))
+    
+    async def daily_job_count(self) -> List[DailyJobCount]:
+        """Fetch daily job count."""
+        data = await self._fetch('dailyJobCount')
+        return _structure_daily_job_counts(data)
+    
+    # Change operations (from apiPeChange.ts)
+    
+    async def insert_jobs(self, inserts: List[Dict[str, Any]]) -> Any:
+        """Insert jobs."""
+        return await self._post('insertJobs', body=inserts)
+    
+    async def update_jobs(self, updates: List[Dict[str, Any]]) -> Any:
+        """Update jobs."""
+        return await self._post('updateJobs', body=updates)
+    
+    async def delete_jobs(self, ids: List[Any]) -> Any:
+        """Delete jobs."""
+        return await self._post('deleteJobs', body=ids)
+    
+    async def insert_programs(self, inserts: List[Dict[str, Any]]) -> Any:
+        """Insert programs."""
+        return await self._post('insertPrograms', body=inserts)
+    
+    async def update_programs(self, updates: List[Dict[str, Any]]) -> Any:
+        """Update programs."""
+        return await self._post('updatePrograms', body=updates)
+    
+    async def delete_programs(self, ids: List[Dict[str, str]]) -> Any:
+        """Delete programs."""
+        return await self._post('deletePrograms', body=ids)
+
+# Request parameters shared by ApiPe and AsyncApiPe
+
+def _to_iso(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp / 1000).isoformat()
+
+def _program_groups_params(group: Optional[Union[str, List[str]]], number: Optional[Union[str, List[str]]],
+                           only_step_counts: bool) -> Dict[str, Any]:
+    params = {}
+    if group is not None:
+        params['group'] = group
+    if number is not None:
+        params['number'] = number
+    if only_step_counts:
+        params['onlyStepCounts'] = True
+    return params
+
+def _history_params(job_id: Any, tags_filter: Optional[str], tags: Optional[List[str]]) -> Dict[str, Any]:
+    params = {'id': id_to_string(job_id)}
+    if tags_filter:
+        params['tagsFilter'] = tags_filter
+    if tags:
+        params['tags'] = ','.join(tags)
+    return params
+
+def _jobs_params(after: Optional[int], before: Optional[int], starts_in_range: bool, no_jobs: bool,
+                 no_stoppages: bool, job_props: Optional[List[str]]) -> Dict[str, Any]:
+    params = {}
+    if after is not None:
+        params['after'] = _to_iso(after)
+    if before is not None:
+        params['before'] = _to_iso(before)
+    if starts_in_range:
+        params['startsInRange'] = True
+    if no_jobs:
+        params['noJobs'] = True
+    if no_stoppages:
+        params['noStoppages'] = True
+    if job_props:
+        params['jobProps'] = job_props
+    return params
+
+def _resource_events_params(alarms: bool, delays: bool, stoppages: bool,
+                            after: Optional[int], before: Optional[int]) -> Dict[str, Any]:
+    params = {}
+    if alarms:
+        params['alarms'] = True
+    if delays:
+        params['delays'] = True
+    if stoppages:
+        params['stoppages'] = True
+    if after is not None:
+        params['after'] = _to_iso(after)
+    if before is not None:
+        params['before'] = _to_iso(before)
+    return params
+
+def _search_params(text: str, limit: Optional[int]) -> Dict[str, Any]:
+    params = {'text': text}
+    if limit is not None:
+        params['limit'] = limit
+    return params
+
+# Response parsing shared by ApiPe and AsyncApiPe
+
+@lru_cache(maxsize=4096)
+def _date_to_timestamp(value: str) -> int:
+    # Many items in a response share the same start/end times
+    return int(parse_datetime(value).timestamp() * 1000)
+
+def _fix_date(value: Any) -> Any:
+    """Convert date strings to timestamps."""
+    if isinstance(value, str):
+        try:
+            return _date_to_timestamp(value)
+        except ValueError:
+            return value
+    return value
+
+def _parse_history(data: Any) -> Optional[AdaptiveHistory]:
+    """Structure a history response and expand its compact arrays."""
+    if not data:
+        return None
+    
+    # Build the history one tag at a time, dropping each raw tag once it has been
+    # converted so the decoded JSON and the expanded arrays never fully coexist
+    raw_tags = data.pop('tags', [])
+    raw_elapsed_times = data.pop('elapsedTimes', [])
+    history = _structure_history({**data, 'elapsedTimes': [], 'tags': []})
+    history.elapsedTimes = _fix_elapsed_times(raw_elapsed_times)
+    del raw_elapsed_times
+    for i in range(len(raw_tags)):
+        tag = _structure_history_tag(raw_tags[i], HistoryTag)
+        raw_tags[i] = None
+        _fix_history_tag(tag)
+        history.tags.append(tag)
+    return history
+
+def _parse_jobs_and_stoppages(data: List[Dict[str, Any]]) -> List[Union[Job, Stoppage]]:
+    """Structure a jobs response into Job and Stoppage objects."""
+    fix_date = _fix_date
+    structure_job = _structure_job
+    structure_stoppage = _structure_stoppage
+    result = []
+    for item in data:
+        # Convert dates to numbers, then to the appropriate object
+        item['start'] = fix_date(item['start'])
+        item['end'] = fix_date(item['end'])
+        result.append(structure_stoppage(item) if 'stoppage' in item else structure_job(item))
+    
+    return result
+
+def _parse_resource_events(data: List[Dict[str, Any]]) -> List[ResourceEvent]:
+    """Structure a resource events response."""
+    fix_date = _fix_date
+    structure_event = _structure_resource_event
+    result = []
+    for item in data:
+        # Convert dates to numbers
+        item['start'] = fix_date(item['start'])
+        item['end'] = fix_date(item['end'])
+        result.append(structure_event(item))
+    
+    return result
+
+def _parse_inbox_jobs(data: List[Dict[str, Any]]) -> List[InBoxGroupAndJobs]:
+    """Structure an inbox jobs response."""
+    # Repopulate resource in each job
+    result = []
+    for group_data in data:
+        group = _structure_inbox_group(group_data)
+        if group.jobs:
+            for job in group.jobs:
+                job.resource = group.group
+        result.append(group)
+    
+    return result
+
+def _parse_search(data: List[Dict[str, Any]]) -> List[SearchResult]:
+    """Structure a search response into Job and InBoxJob objects."""
+    fix_date = _fix_date
+    structure_job = _structure_job
+    structure_inbox_job = _structure_inbox_job
+    result = []
+    for item in data:
+        # Convert dates to numbers, then to the appropriate object
+        if 'start' in item:
+            item['start'] = fix_date(item['start'])
+            result.append(structure_job(item))
+        else:
+            result.append(structure_inbox_job(item))
+    
+    return result
+
+def _fix_elapsed_times(elapsed_times: List[int]) -> List[int]:
+    """Decode elapsed times, which are delta-of-delta encoded on the wire."""
+    return np.cumsum(np.cumsum(np.asarray(elapsed_times, dtype=np.int64))).tolist()
+
+def _accumulate_values(tag: HistoryTag) -> None:
+    """Numeric and date values are sent as deltas from the previous value."""
+    values = np.asarray(tag.values)
+    tag.values = np.cumsum(values, out=values)
+
+def _expand_boolean_values(tag: HistoryTag) -> None:
+    """Boolean values are sent as a single initial value that toggles at each index."""
+    values1 = tag.values
+    if len(values1) > 0:
+        parity = np.arange(max(len(tag.elapsedIndexes), 1), dtype=np.uint8) & 1
+        tag.values = (np.uint8(bool(values1[0])) ^ parity).astype(bool)
+
+# Value decoders by tag type, other types are sent as plain values
+_HISTORY_VALUE_DECODERS: Dict[str, Callable[[HistoryTag], None]] = {
+    'number': _accumulate_values,
+    'date': _accumulate_values,
+    'boolean': _expand_boolean_values,
+}
+
+def _fix_history_tag(tag: HistoryTag) -> None:
+    """Decode the delta encoded indexes and values of a single history tag."""
+    # Prefix sums are done in place on the arrays built by the converter
+    elapsed_indexes = np.asarray(tag.elapsedIndexes, dtype=np.int64)
+    tag.elapsedIndexes = np.cumsum(elapsed_indexes, out=elapsed_indexes)
+    
+    if isinstance(tag.type, str):
+        decode_values = _HISTORY_VALUE_DECODERS.get(tag.type)
+        if decode_values is not None:
+            decode_values(tag)
+
+def _forward_fill(tag: HistoryTag, num_rows: int) -> np.ndarray:
+    """Spread a tag's values over every global elapsed time step as CSV cells."""
+    count = min(len(tag.elapsedIndexes), len(tag.values))
+    indexes = tag.elapsedIndexes[:count]
+    in_range = indexes < num_rows
+    
+    # Position of the last recorded value at each step, -1 before the first one
+    positions = np.full(num_rows, -1, dtype=np.int64)
+    positions[indexes[in_range]] = np.arange(count, dtype=np.int64)[in_range]
+    np.maximum.accumulate(positions, out=positions)
+    
+    cells = np.empty(count + 1, dtype=object)
+    cells[0] = ''
+    cells[1:] = ['' if value is None else str(value) for value in tag.values[:count].tolist()]
+    return cells[positions + 1]
+
+def _format_times(start: datetime, elapsed_times: List[int]) -> List[str]:
+    """Format start + elapsed milliseconds as ISO 8601 strings with millisecond precision."""
+    # Formatted as the wall time of 'start', the same as strftime would
+    origin = np.datetime64(start.replace(tzinfo=None), 'ms')
+    times = origin + np.asarray(elapsed_times, dtype=np.int64).astype('timedelta64[ms]')
+    return np.char.add(np.datetime_as_string(times, unit='ms'), 'Z').tolist()
 
 def history_to_csv(history: AdaptiveHistory) -> str:
     output = StringIO()
@@ -488,33 +696,15 @@ def history_to_csv(history: AdaptiveHistory) -> str:
     header = ['ElapsedTime', 'Time'] + [tag.name for tag in history.tags]
     writer.writerow(header)
 
-    num_tags = len(history.tags)
-    last_values = [None] * num_tags
-    tag_pointers = [0] * num_tags 
+    num_rows = len(history.elapsedTimes)
+    columns = [_forward_fill(tag, num_rows) for tag in history.tags]
+    tag_cells = zip(*columns) if columns else repeat((), num_rows)
+    times = _format_times(history.start, history.elapsedTimes)
     
-    # Iterate through every global elapsed time step
-    for i in range(len(history.elapsedTimes)):
-        row = [
-            str(history.elapsedTimes[i]),
-            (history.start + timedelta(milliseconds=history.elapsedTimes[i])).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + 'Z'
-        ]   
-        
-        for t_idx, tag in enumerate(history.tags):
-            ptr = tag_pointers[t_idx]
-            
-            # Check if the current global step 'i' matches the tag's next recorded index
-            if ptr < len(tag.elapsedIndexes) and tag.elapsedIndexes[ptr] == i:
-                # Update the last known value and move the pointer forward
-                current_value = tag.values[ptr]
-                last_values[t_idx] = current_value
-                tag_pointers[t_idx] = ptr + 1
-            else:
-                # Use the carried-over value (Forward Fill)
-                current_value = last_values[t_idx]
-            
-            row.append(str(current_value) if current_value is not None else '')
-            
-        writer.writerow(row)
+    # One row for every global elapsed time step
+    writer.writerows(
+        [str(elapsed), time, *cells]
+        for elapsed, time, cells in zip(history.elapsedTimes, times, tag_cells)
+    )
     
-    return output.getvalue()
-    
\ No newline at end of file
+    return output.getvalue()
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""History decoding and CSV output, checked against the original loop implementation."""
+import copy
+import csv
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+
+from adaptive_api.base import parse_datetime
+from adaptive_api.pe import _parse_history, history_to_csv
+
+
+def _reference_decode(raw):
+    """Decode a history response the way the pre-NumPy client did, on plain lists."""
+    elapsed_times = list(raw['elapsedTimes'])
+    prev = 0
+    prev_delta = 0
+    for i in range(len(elapsed_times)):
+        delta = prev_delta + elapsed_times[i]
+        prev_delta = delta
+        prev = prev + delta
+        elapsed_times[i] = prev
+
+    tags = []
+    for raw_tag in raw['tags']:
+        elapsed_indexes = list(raw_tag['elapsedIndexes'])
+        prev = 0
+        for i in range(len(elapsed_indexes)):
+            prev = prev + elapsed_indexes[i]
+            elapsed_indexes[i] = prev
+
+        values = list(raw_tag['values'])
+        if raw_tag['type'] == 'number' or raw_tag['type'] == 'date':
+            prev = 0
+            for i in range(len(values)):
+                prev = prev + values[i]
+                values[i] = prev
+        elif raw_tag['type'] == 'boolean' and len(values) > 0:
+            last_value = values[0]
+            values = [last_value]
+            for i in range(1, len(elapsed_indexes)):
+                last_value = not last_value
+                values.append(last_value)
+        tags.append((raw_tag['name'], elapsed_indexes, values))
+    return elapsed_times, tags
+
+
+def _reference_csv(raw):
+    """history_to_csv as it was before the NumPy rewrite."""
+    start = parse_datetime(raw['start'])
+    elapsed_times, tags = _reference_decode(raw)
+    output = StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(['ElapsedTime', 'Time'] + [name for name, _, _ in tags])
+
+    last_values = [None] * len(tags)
+    tag_pointers = [0] * len(tags)
+    for i in range(len(elapsed_times)):
+        row = [
+            str(elapsed_times[i]),
+            (start + timedelta(milliseconds=elapsed_times[i])).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + 'Z'
+        ]
+        for t_idx, (_, elapsed_indexes, values) in enumerate(tags):
+            ptr = tag_pointers[t_idx]
+            if ptr < len(elapsed_indexes) and elapsed_indexes[ptr] == i:
+                current_value = values[ptr]
+                last_values[t_idx] = current_value
+                tag_pointers[t_idx] = ptr + 1
+            else:
+                current_value = last_values[t_idx]
+            row.append(str(current_value) if current_value is not None else '')
+        writer.writerow(row)
+    return output.getvalue()
+
+
+def _history(elapsed_times, tags, start='2024-03-05T06:07:08Z'):
+    return {
+        'id': 'J1',
+        'start': start,
+        'end': '2024-03-05T18:00:00Z',
+        'elapsedTimes': elapsed_times,
+        'tags': [
+            {'name': name, 'type': tag_type, 'elapsedIndexes': indexes, 'values': values}
+            for name, tag_type, indexes, values in tags
+        ],
+    }
+
+
+FIXTURES = {
+    'int_led_number_with_float': _history(
+        [0, 1000, 0, 0, 0, 0],
+        [('Temp', 'number', [0, 1, 1, 1, 1, 1], [10, 10, 0.5, 9.5, 1, -21])],
+    ),
+    'float_led_number': _history(
+        [0, 500, 0, 0],
+        [('Level', 'number', [0, 1, 1, 1], [0.5, 1, 2, 3])],
+    ),
+    'date_with_fractional_deltas': _history(
+        [0, 10, 0],
+        [('Stamp', 'date', [0, 1, 1], [1709618828000, 1.5, 2.25])],
+    ),
+    'boolean_without_indexes': _history(
+        [0, 100, 0],
+        [('Running', 'boolean', [], [True])],
+    ),
+    'boolean_with_one_index': _history(
+        [0, 100, 0],
+        [('Running', 'boolean', [1], [False])],
+    ),
+    'boolean_toggles': _history(
+        [0, 100, 0, 0, 0],
+        [('Running', 'boolean', [0, 2, 1], [True])],
+    ),
+    'first_index_after_start': _history(
+        [0, 250, 0, 0, 0],
+        [('Temp', 'number', [2, 1, 1], [50, 1, -2]), ('Step', 'number', [0, 4], [1, 1])],
+    ),
+    'empty_elapsed_times': _history(
+        [],
+        [('Temp', 'number', [], []), ('Name', 'string', [], [])],
+    ),
+    'start_with_microseconds': _history(
+        [0, 1, 0, 998, 0],
+        [('Temp', 'number', [0, 1], [1, 2])],
+        start='2024-03-05T06:07:08.123999Z',
+    ),
+    'start_with_offset': _history(
+        [0, 1000],
+        [('Temp', 'number', [0, 1], [1, 2])],
+        start='2024-03-05T06:07:08.500+02:00',
+    ),
+    'string_and_none_values': _history(
+        [0, 60000, 0, 0, 0],
+        [('Name', 'string', [0, 1, 1, 2], ['first', None, 'third', 'fourth'])],
+    ),
+    'no_tags': _history([0, 100, 0], []),
+}
+
+
+@pytest.mark.parametrize('raw', FIXTURES.values(), ids=FIXTURES.keys())
+def test_parse_history_matches_reference(raw):
+    history = _parse_history(copy.deepcopy(raw))
+    elapsed_times, tags = _reference_decode(raw)
+
+    assert history.elapsedTimes == elapsed_times
+    assert [tag.name for tag in history.tags] == [name for name, _, _ in tags]
+    for tag, (_, elapsed_indexes, values) in zip(history.tags, tags):
+        assert tag.elapsedIndexes.tolist() == elapsed_indexes
+        decoded = tag.values.tolist()
+        assert decoded == values
+        # 20 and 20.0 compare equal but are written differently
+        assert [type(value) for value in decoded] == [type(value) for value in values]
+
+
+@pytest.mark.parametrize('raw', FIXTURES.values(), ids=FIXTURES.keys())
+def test_history_to_csv_matches_reference(raw):
+    assert history_to_csv(_parse_history(copy.deepcopy(raw))) == _reference_csv(raw)
+
+
+def test_time_column_truncates_to_milliseconds():
+    csv_text = history_to_csv(_parse_history(copy.deepcopy(FIXTURES['start_with_microseconds'])))
+    times = [line.split(',')[1] for line in csv_text.splitlines()[1:]]
+    assert times == [
+        '2024-03-05T06:07:08.123Z',
+        '2024-03-05T06:07:08.124Z',
+        '2024-03-05T06:07:08.125Z',
+        '2024-03-05T06:07:09.124Z',
+        '2024-03-05T06:07:10.123Z',
+    ]
+
+
+def test_parsed_histories_compare_equal():
+    raw = FIXTURES['first_index_after_start']
+    assert _parse_history(copy.deepcopy(raw)) == _parse_history(copy.deepcopy(raw))